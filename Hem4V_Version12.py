@@ -1,18 +1,30 @@
 import os
+import atexit
 import sys
 import subprocess
 import shutil
+import stat
+import sysconfig
 import urllib.request
 import json
+import locale
+import re
+import hashlib
 import tempfile
 import traceback
-import glob
-from datetime import datetime
+import threading
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 
 # Use a cross-platform directory inside the user's home folder
 WORKDIR = os.path.join(os.path.expanduser("~"), "Hem4V")
 LOGDIR = os.path.join(WORKDIR, "logs")
-LOGFILE = os.path.join(LOGDIR, f"log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
+LOGFILE = os.path.join(LOGDIR, f"log_{time.strftime('%Y%m%d_%H%M%S')}.txt")
+CACHEDIR = os.path.join(WORKDIR, "cache")
+CMD_CACHEDIR = os.path.join(CACHEDIR, "cmds")
+PIPCACHEDIR = os.path.join(WORKDIR, "pipcache")
 
 WORKFLOW_STEPS = [
     "Tworzenie folderu roboczego",
@@ -22,47 +34,154 @@ WORKFLOW_STEPS = [
     "Uruchomienie projektu"
 ]
 MAX_ATTEMPTS = 2
+GIT_JOBS = 8
+
+# Windows: helper commands (git, pip, npm) run without allocating a console window
+if os.name == "nt":
+    _startupinfo = subprocess.STARTUPINFO()
+    _startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _startupinfo.wShowWindow = 0  # SW_HIDE
+    _NO_WINDOW = {"startupinfo": _startupinfo, "creationflags": subprocess.CREATE_NO_WINDOW}
+else:
+    _NO_WINDOW = {}
+
+# Child output is decoded like text=True would: with the locale (ANSI code page on Windows)
+_CHILD_ENCODING = locale.getpreferredencoding(False)
+
+# run_cmd may log from worker threads; keep lines whole on screen and in LOGFILE
+_LOG_LOCK = threading.Lock()
+
+os.makedirs(LOGDIR, exist_ok=True)
+_LOG_FH = open(LOGFILE, "a", encoding="utf-8", buffering=1 << 16)
+atexit.register(_LOG_FH.close)
 
 def write_logfile(msg):
-    try:
-        os.makedirs(LOGDIR, exist_ok=True)
-        with open(LOGFILE, "a", encoding="utf-8") as f:
-            f.write(msg + "\n")
-    except Exception:
-        pass
+    # Called under _LOG_LOCK; info lines stay in the buffer, log_error flushes
+    _LOG_FH.write(msg)
+    _LOG_FH.write("\n")
 
 def log(msg):
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
     logline = f"[{timestamp}] {msg}"
-    print(logline)
-    write_logfile(logline)
+    with _LOG_LOCK:
+        print(logline)
+        write_logfile(logline)
 
 def log_error(msg):
     # ANSI escape for red
     red = "\033[91m"
     reset = "\033[0m"
     full_msg = f"{red}BŁĄD: {msg}{reset}"
-    print(full_msg)
-    write_logfile(f"BŁĄD: {msg}")
+    with _LOG_LOCK:
+        print(full_msg)
+        write_logfile(f"BŁĄD: {msg}")
+        _LOG_FH.flush()
 
+@lru_cache(maxsize=32)
 def check_exe(cmd):
     return shutil.which(cmd) is not None
 
+def _cache_key(*parts):
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+def _release_asset(api_url, name_pattern):
+    """Return name/size/url/sha256 of the matching release asset, or None without metadata."""
+    try:
+        req = urllib.request.Request(api_url, headers={"Accept": "application/vnd.github+json"})
+        with urllib.request.urlopen(req, timeout=15) as resp:
+            release = json.load(resp)
+    except Exception as e:
+        log(f"Nie udało się pobrać metadanych wydania ({e}).")
+        return None
+    for asset in release.get("assets", []):
+        name = asset.get("name") or ""
+        if re.fullmatch(name_pattern, name) and asset.get("browser_download_url"):
+            algo, _, value = (asset.get("digest") or "").partition(":")
+            return {
+                "name": name,
+                "size": asset.get("size"),
+                "url": asset["browser_download_url"],
+                "sha256": value.lower() if algo == "sha256" and value else None,
+            }
+    log("Nie znaleziono instalatora w metadanych wydania.")
+    return None
+
+def _copy_hashed(src, dest):
+    # Hash in the same loop as the write, so the file is never read back from disk
+    h = hashlib.sha256()
+    with open(dest, "wb") as f:
+        for chunk in iter(lambda: src.read(1 << 20), b""):
+            f.write(chunk)
+            h.update(chunk)
+    return h.hexdigest()
+
+def _cached_download(url, dest, asset=None):
+    if asset is None:
+        # Without release metadata there is no stable cache key, so download uncached
+        log("Brak metadanych wydania – pobieram bez cache i bez weryfikacji sumy kontrolnej.")
+        with urllib.request.urlopen(url) as resp, open(dest, "wb") as f:
+            shutil.copyfileobj(resp, f, length=1 << 20)
+        return
+    # Key on stable release data (digest, name, size), not the signed CDN URL
+    expected = asset["sha256"]
+    cache_path = os.path.join(CACHEDIR, f"{_cache_key(expected or '', asset['name'], asset['size'])}.exe")
+    if os.path.isfile(cache_path):
+        with open(cache_path, "rb") as src:
+            digest = _copy_hashed(src, dest)
+        if expected is None or digest == expected:
+            log(f"Używam instalatora z cache: {cache_path}")
+            return
+        log("Instalator w cache ma niezgodną sumę SHA-256 – pobieram ponownie.")
+        try:
+            os.unlink(cache_path)
+        except OSError:
+            pass
+    with urllib.request.urlopen(asset["url"]) as resp:
+        digest = _copy_hashed(resp, dest)
+    if expected is None:
+        log(f"Brak sumy kontrolnej dla {asset['name']} – pomijam weryfikację.")
+    elif digest != expected:
+        raise ValueError(f"Niezgodna suma SHA-256 pobranego pliku: {digest} (oczekiwano {expected})")
+    os.makedirs(CACHEDIR, exist_ok=True)
+    shutil.copyfile(dest, cache_path + ".part")
+    os.replace(cache_path + ".part", cache_path)
+
 def install_git():
     git_url = "https://github.com/git-for-windows/git/releases/latest/download/Git-64-bit.exe"
+    release_api = "https://api.github.com/repos/git-for-windows/git/releases/latest"
     temp_path = os.path.join(tempfile.gettempdir(), "Git-64-bit.exe")
+    install_log = os.path.join(LOGDIR, "git_install.log")
+    # No dialogs and a minimal component set, so fewer files to extract
+    installer_args = [
+        "/VERYSILENT", "/SUPPRESSMSGBOXES", "/SP-", "/NORESTART", "/CLOSEAPPLICATIONS", "/NOCANCEL",
+        "/COMPONENTS=icons,ext\\reg\\shellhere,assoc,assoc_sh",
+        f"/LOG={install_log}",
+    ]
+    asset = None
     for attempt in range(1, MAX_ATTEMPTS+1):
         try:
             log(f"Próbuję pobrać Git (próba {attempt}/{MAX_ATTEMPTS}): {git_url}")
-            urllib.request.urlretrieve(git_url, temp_path)
+            if asset is None:
+                asset = _release_asset(release_api, r"Git-.+-64-bit\.exe")
+            _cached_download(git_url, temp_path, asset)
             log(f"Pobrano instalator do: {temp_path}")
             log("Instaluję Git (tryb cichy)...")
-            proc = subprocess.run([temp_path, "/VERYSILENT", "/NORESTART"], check=False, capture_output=True, text=True)
+            # The installer writes next to nothing to stdout; details go to /LOG
+            proc = subprocess.run([temp_path, *installer_args], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             if proc.returncode != 0:
+                try:
+                    with open(install_log, "r", encoding="utf-8", errors="replace") as f:
+                        log_tail = "".join(f.readlines()[-20:]).strip()
+                except OSError:
+                    log_tail = "(brak logu instalatora)"
                 error_msg = (
                     f"Błąd podczas instalacji Git! Kod wyjścia: {proc.returncode}\n"
-                    f"stdout: {proc.stdout.strip()}\n"
-                    f"stderr: {proc.stderr.strip()}\n"
+                    f"Log instalatora: {install_log}\n"
+                    f"{log_tail}\n"
                 )
                 log_error(error_msg)
                 if attempt == MAX_ATTEMPTS:
@@ -70,7 +189,11 @@ def install_git():
                 else:
                     continue
             log("Git został zainstalowany.")
-            os.remove(temp_path)
+            check_exe.cache_clear()
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
             return True
         except Exception as e:
             tb = traceback.format_exc()
@@ -108,14 +231,89 @@ def ensure_npm():
         log_error(msg)
         return False
 
-def run_cmd(cmd, cwd=None, shell=False):
+def _log_lines(buf):
+    # Log complete lines from buf and keep the unfinished tail in it
+    start = 0
+    end = buf.find(b"\n")
+    while end != -1:
+        log(buf[start:end].decode(_CHILD_ENCODING, "replace").rstrip())
+        start = end + 1
+        end = buf.find(b"\n", start)
+    del buf[:start]
+
+def npm_cmd(*args):
+    # On Windows npm is npm.cmd, which CreateProcess cannot start without cmd.exe
+    return ["cmd.exe", "/c", "npm", *args] if os.name == "nt" else ["npm", *args]
+
+def _cmd_result_path(cmd, cwd, inputs):
+    contents = []
+    for path in inputs:
+        try:
+            with open(path, "rb") as f:
+                contents.append(f.read())
+        except OSError:
+            contents.append(b"")
+    return os.path.join(CMD_CACHEDIR, f"{_cache_key(*cmd, cwd, *contents)}.json")
+
+def _npm_probe(target_dir):
+    # npm rewrites its hidden lockfile only when it adds or removes packages,
+    # not when tools write caches such as node_modules/.vite
+    try:
+        with open(os.path.join(target_dir, "node_modules", ".package-lock.json"), "rb") as f:
+            return _cache_key(f.read())
+    except OSError:
+        return None
+
+def _pip_probe(purelib):
+    # Names of all distributions installed in the interpreter, not just this project's:
+    # an unrelated install or uninstall also invalidates the memo
+    try:
+        return _cache_key(*sorted(n for n in os.listdir(purelib) if n.endswith(".dist-info")))
+    except OSError:
+        return None
+
+def _cmd_cached(cmd, result_path, probe):
+    try:
+        with open(result_path, "r", encoding="utf-8") as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if probe is not None:
+        fingerprint = probe()
+        if fingerprint is None or fingerprint != result.get("probe"):
+            return False
+    log(f"Bez zmian od ostatniej instalacji – pomijam: {' '.join(cmd)}")
+    return True
+
+def _store_cmd_result(cmd, result_path, probe):
+    try:
+        os.makedirs(CMD_CACHEDIR, exist_ok=True)
+        with open(result_path, "w", encoding="utf-8") as f:
+            json.dump({"cmd": cmd, "returncode": 0, "probe": probe() if probe else None}, f)
+    except OSError:
+        pass
+
+def run_cmd(cmd, cwd=None, shell=False, env=None, hidden=True, inputs=(), probe=None):
+    result_path = _cmd_result_path(cmd, cwd, inputs) if inputs else None
+    if result_path and _cmd_cached(cmd, result_path, probe):
+        return 0
     log(f"Uruchamiam: {' '.join(cmd) if isinstance(cmd, list) else cmd}")
     for attempt in range(1, MAX_ATTEMPTS+1):
         try:
-            proc = subprocess.Popen(cmd, cwd=cwd, shell=shell, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-            for line in proc.stdout:
-                log(line.rstrip())
-            proc.wait()
+            # Leaving the with block closes the pipe and waits; wait() without a timeout
+            # blocks in waitpid/WaitForSingleObject, so there is no polling here
+            extra = _NO_WINDOW if hidden else {}
+            with subprocess.Popen(cmd, cwd=cwd, shell=shell, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0, **extra) as proc:
+                fd = proc.stdout.fileno()
+                buf = bytearray()
+                while True:
+                    chunk = os.read(fd, 1 << 16)
+                    if not chunk:
+                        break
+                    buf += chunk
+                    _log_lines(buf)
+                if buf:
+                    log(buf.decode(_CHILD_ENCODING, "replace").rstrip())
             if proc.returncode != 0:
                 error_msg = f"Błąd! Kod wyjścia: {proc.returncode}"
                 log_error(error_msg)
@@ -124,6 +322,8 @@ def run_cmd(cmd, cwd=None, shell=False):
                 else:
                     log(f"Ponawiam próbę ({attempt+1}/{MAX_ATTEMPTS}) ...")
                     continue
+            if result_path:
+                _store_cmd_result(cmd, result_path, probe)
             return 0
         except Exception as e:
             tb = traceback.format_exc()
@@ -133,29 +333,96 @@ def run_cmd(cmd, cwd=None, shell=False):
                 return -1
     return -1
 
+async def _install_all(installs, cwd, env):
+    # Independent installers (pip, npm) run side by side; each keeps run_cmd's retry loop
+    return await asyncio.gather(*(asyncio.to_thread(run_cmd, cmd, cwd=cwd, env=env, inputs=inputs, probe=probe) for cmd, inputs, probe, _ in installs))
+
 def parse_repo_name(repo_url):
-    name = repo_url.rstrip('/').split('/')[-1]
-    if name.endswith('.git'):
-        name = name[:-4]
-    return name
+    return repo_url.rstrip('/').rpartition('/')[2].removesuffix('.git')
 
-def find_python_entrypoint(target_dir):
-    candidates = ["main.py", "app.py", "index.py"]
+def _retry_remove(func, path, exc):
+    # exc is the exception (onexc) or an exc_info tuple (onerror)
+    if isinstance(exc, tuple):
+        exc = exc[1]
+    if isinstance(exc, FileNotFoundError):
+        return
+    # Only removals are retried: on Windows .git files can be read-only or briefly
+    # locked by antivirus/indexing. Failures of scandir, open, lstat etc. propagate.
+    if func not in (os.unlink, os.rmdir, os.remove):
+        raise exc
+    os.chmod(path, stat.S_IWRITE)
+    try:
+        func(path)
+    except OSError:
+        time.sleep(0.5)
+        func(path)
+
+def remove_tree(path):
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_retry_remove)
+    else:
+        shutil.rmtree(path, onerror=_retry_remove)
+
+def update_existing_clone(target_dir, repo_url):
+    """Update an existing clone of repo_url in place; False means clone from scratch."""
+    if not os.path.isdir(os.path.join(target_dir, ".git")):
+        return False
+    try:
+        proc = subprocess.run(["git", "-C", target_dir, "remote", "get-url", "origin"], check=False, capture_output=True, text=True, **_NO_WINDOW)
+    except Exception:
+        return False
+    if proc.returncode != 0 or proc.stdout.strip().rstrip('/') != repo_url.rstrip('/'):
+        return False
+    log(f"Repozytorium już istnieje – aktualizuję {target_dir} ...")
+    if run_cmd(["git", "-C", target_dir, "fetch", "--depth=1", "--prune", f"--jobs={GIT_JOBS}"]) != 0:
+        return False
+    if run_cmd(["git", "-C", target_dir, "reset", "--hard", "FETCH_HEAD"]) != 0:
+        return False
+    if os.path.isfile(os.path.join(target_dir, ".gitmodules")):
+        return run_cmd(["git", "-C", target_dir, "submodule", "update", "--init", "--recursive", "--depth=1", f"--jobs={GIT_JOBS}"]) == 0
+    return True
+
+def scan_python_entrypoints(target_dir):
+    candidates = ("main.py", "app.py", "index.py")
+    found = {}
+    pyfiles = []
+    # Windows file names are case-insensitive, so Main.py counts as main.py there
+    fold = os.name == "nt"
+    # One pass over the directory; DirEntry.is_file() reuses data from readdir
+    with os.scandir(target_dir) as it:
+        for entry in it:
+            name = entry.name
+            key = name.lower() if fold else name
+            if not key.endswith(".py") or not entry.is_file():
+                continue
+            if key in candidates:
+                found[key] = name
+            elif key != "setup.py":
+                pyfiles.append(name)
     for fname in candidates:
-        path = os.path.join(target_dir, fname)
-        if os.path.isfile(path):
-            return fname
-    pyfiles = [os.path.basename(f) for f in glob.glob(os.path.join(target_dir, "*.py")) if os.path.basename(f) != "setup.py"]
-    if len(pyfiles) == 1:
+        if fname in found:
+            return [found[fname]]
+    return pyfiles
+
+def find_python_entrypoint(target_dir, pyfiles=None):
+    if pyfiles is None:
+        pyfiles = scan_python_entrypoints(target_dir)
+    count = len(pyfiles)
+    if count == 1:
         return pyfiles[0]
-    elif len(pyfiles) > 1:
+    elif count > 1:
+        pyfiles = sorted(pyfiles)
+        if sys.stdin is None or not sys.stdin.isatty():
+            # Without a terminal input() would block forever, so pick the first file
+            log(f"Brak terminala – automatycznie wybieram {pyfiles[0]}")
+            return pyfiles[0]
         print("Nie znaleziono jednoznacznego pliku startowego. Możliwe pliki:")
         for idx, f in enumerate(pyfiles):
             print(f"{idx+1}. {f}")
         while True:
             try:
                 choice = int(input("Podaj numer pliku do uruchomienia: "))
-                if 1 <= choice <= len(pyfiles):
+                if 1 <= choice <= count:
                     return pyfiles[choice-1]
             except Exception:
                 pass
@@ -189,73 +456,107 @@ def do_workflow(repo_url):
         # 3. Klonowanie repozytorium
         repo_name = parse_repo_name(repo_url)
         target_dir = os.path.join(WORKDIR, repo_name)
-        if os.path.exists(target_dir):
-            log(f"Usuwam istniejący folder {target_dir} ...")
-            try:
-                shutil.rmtree(target_dir)
-            except Exception as e:
-                error_msg = f"Nie mogę usunąć folderu: {e}"
-                log_error(error_msg)
+        if update_existing_clone(target_dir, repo_url):
+            log(f"Zaktualizowano {target_dir}")
+        else:
+            if os.path.exists(target_dir):
+                log(f"Usuwam istniejący folder {target_dir} ...")
+                try:
+                    remove_tree(target_dir)
+                except Exception as e:
+                    error_msg = f"Nie mogę usunąć folderu: {e}"
+                    log_error(error_msg)
+                    return
+            log(f"Klonuję repozytorium...")
+            # Shallow, blobless clone of the default branch tip; submodules fetched in parallel
+            exit_code = run_cmd(["git", "-c", "protocol.version=2", "clone", "--depth=1", "--filter=blob:none", "--single-branch",
+                                 "--recurse-submodules", "--shallow-submodules", f"--jobs={GIT_JOBS}", repo_url], cwd=WORKDIR)
+            if exit_code != 0:
+                log_error("Błąd podczas klonowania repozytorium!")
                 return
-        log(f"Klonuję repozytorium...")
-        exit_code = run_cmd(["git", "clone", repo_url], cwd=WORKDIR)
-        if exit_code != 0:
-            log_error("Błąd podczas klonowania repozytorium!")
-            return
-        log(f"Sklonowano do {target_dir}")
+            log(f"Sklonowano do {target_dir}")
         step_idx += 1
         progress()
 
         # 4. Instalacja zależności
         req_path = os.path.join(target_dir, "requirements.txt")
-        pyproject_path = os.path.join(target_dir, "pyproject.toml")
-        setup_path = os.path.join(target_dir, "setup.py")
         pkg_path = os.path.join(target_dir, "package.json")
 
-        if os.path.isfile(req_path):
-            log("Wykryto projekt Python (requirements.txt).")
-            if not ensure_python():
-                return
-            log("Instaluję zależności: pip install -r requirements.txt")
-            exit_code = run_cmd([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], cwd=target_dir)
-            if exit_code != 0:
-                log_error("Błąd podczas instalowania zależności pip!")
-                return
-        elif os.path.isfile(pyproject_path) or os.path.isfile(setup_path):
-            log("Wykryto projekt Python (pyproject.toml lub setup.py).")
-            if not ensure_python():
-                return
-            log("Instaluję zależności: pip install .")
-            exit_code = run_cmd([sys.executable, "-m", "pip", "install", "."], cwd=target_dir)
-            if exit_code != 0:
-                log_error("Błąd podczas instalowania zależności pip!")
-                return
-        elif os.path.isfile(pkg_path):
-            log("Wykryto projekt Node.js (package.json).")
-            if not ensure_npm():
-                return
-            log("Instaluję zależności npm ...")
-            exit_code = run_cmd(["npm", "install"], cwd=target_dir)
-            if exit_code != 0:
-                log_error("Błąd podczas npm install!")
+        # One directory listing instead of a stat per manifest;
+        # step 5 only uses these flags
+        with os.scandir(target_dir) as it:
+            top_files = {entry.name for entry in it if entry.is_file()}
+        has_req = "requirements.txt" in top_files
+        is_python = has_req or "pyproject.toml" in top_files or "setup.py" in top_files
+        has_pkg = "package.json" in top_files
+
+        pip_install = [sys.executable, "-m", "pip", "install", "--prefer-binary", "--cache-dir", PIPCACHEDIR, "--no-compile"]
+        npm_flags = ["--prefer-offline", "--no-audit", "--no-fund"]
+        install_env = dict(os.environ, PIP_DISABLE_PIP_VERSION_CHECK="1", PYTHONDONTWRITEBYTECODE="1")
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            installs = []
+            if is_python:
+                # The entrypoint scan does not depend on pip, so start it right away
+                entry_future = pool.submit(scan_python_entrypoints, target_dir)
+                if has_req:
+                    log("Wykryto projekt Python (requirements.txt).")
+                    if not ensure_python():
+                        return
+                    log("Instaluję zależności: pip install -r requirements.txt")
+                    # Re-run when requirements.txt or the interpreter's installed distributions change
+                    installs.append((pip_install + ["-r", "requirements.txt"], [req_path], partial(_pip_probe, sysconfig.get_paths()["purelib"]), "Błąd podczas instalowania zależności pip!"))
+                else:
+                    log("Wykryto projekt Python (pyproject.toml lub setup.py).")
+                    if not ensure_python():
+                        return
+                    log("Instaluję zależności: pip install .")
+                    installs.append((pip_install + ["."], [], None, "Błąd podczas instalowania zależności pip!"))
+            if has_pkg:
+                log("Wykryto projekt Node.js (package.json).")
+                if not is_python and not ensure_npm():
+                    return
+                if is_python and not check_exe("npm"):
+                    log("Brak npm – pomijam instalację zależności Node.js.")
+                else:
+                    log("Instaluję zależności npm ...")
+                    lock_path = os.path.join(target_dir, "package-lock.json")
+                    # npm ci installs straight from the lockfile without resolving dependencies
+                    npm_install = npm_cmd("ci" if "package-lock.json" in top_files else "install", *npm_flags)
+                    # Re-run when package.json/package-lock.json or the installed package set change
+                    installs.append((npm_install, [pkg_path, lock_path], partial(_npm_probe, target_dir), "Błąd podczas npm install!"))
+            if not installs:
+                msg = "Nie wykryto obsługiwanej technologii (brak requirements.txt / package.json)!"
+                log_error(msg)
                 return
-        else:
-            msg = "Nie wykryto obsługiwanej technologii (brak requirements.txt / package.json)!"
-            log_error(msg)
-            return
+
+            if len(installs) == 1:
+                cmd, inputs, probe, error_msg = installs[0]
+                if run_cmd(cmd, cwd=target_dir, env=install_env, inputs=inputs, probe=probe) != 0:
+                    log_error(error_msg)
+                    return
+            else:
+                exit_codes = asyncio.run(_install_all(installs, target_dir, install_env))
+                failed = False
+                for (_, _, _, error_msg), exit_code in zip(installs, exit_codes):
+                    if exit_code != 0:
+                        log_error(error_msg)
+                        failed = True
+                if failed:
+                    return
         step_idx += 1
         progress()
 
         # 5. Uruchomienie projektu
-        if os.path.isfile(req_path) or os.path.isfile(pyproject_path) or os.path.isfile(setup_path):
-            entry_py = find_python_entrypoint(target_dir)
+        if is_python:
+            entry_py = find_python_entrypoint(target_dir, entry_future.result())
             if entry_py:
                 log(f"Uruchamiam {entry_py} ...")
-                run_cmd([sys.executable, entry_py], cwd=target_dir)
+                run_cmd([sys.executable, entry_py], cwd=target_dir, hidden=False)
             else:
                 msg = "Nie znaleziono pliku startowego Python – projekt nie został uruchomiony."
                 log_error(msg)
-        elif os.path.isfile(pkg_path):
+        elif has_pkg:
             try:
                 with open(pkg_path, "r", encoding="utf-8") as f:
                     pkg_data = json.load(f)
@@ -267,10 +568,10 @@ def do_workflow(repo_url):
 
             if start_script:
                 log("Uruchamiam npm start ...")
-                run_cmd(["npm", "start"], cwd=target_dir)
+                run_cmd(npm_cmd("start"), cwd=target_dir, hidden=False)
             elif main_entry:
                 log(f"Uruchamiam node {main_entry} ...")
-                run_cmd(["node", main_entry], cwd=target_dir)
+                run_cmd(["node", main_entry], cwd=target_dir, hidden=False)
             else:
                 msg = "Brak skryptu start w package.json – projekt nie został uruchomiony."
                 log_error(msg)